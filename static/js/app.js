@@ -0,0 +1,308 @@
+// Initialize filter functionality
+function initializeFilters() {
+  const todoItems = document.querySelectorAll('.todo-item');
+  const noResults = document.getElementById('noResults');
+
+  // Get all filter checkboxes
+  const allFilters = {
+    status: document.querySelectorAll('input[name="status"]'),
+    assignee: document.querySelectorAll('input[name="assignee"]')
+  };
+
+  // Store the original state of all items
+  const itemStates = Array.from(todoItems).map(item => ({
+    element: item,
+    status: item.dataset.status,
+    assignee: item.dataset.assignee
+  }));
+
+  // Update the counts display
+  function updateCounts() {
+    const counts = {
+      status: { todo: 0, in_progress: 0, done: 0 },
+      assignee: { unassigned: 0 }
+    };
+
+    // Count all items (excluding the "No tasks yet" message)
+    const realTodoItems = Array.from(document.querySelectorAll('.todo-item')).filter(
+      el => !el.textContent.includes('No tasks yet')
+    );
+
+    realTodoItems.forEach(element => {
+      const status = element.dataset.status;
+      const assignee = element.dataset.assignee || 'unassigned';
+      counts.status[status]++;
+      counts.assignee[assignee] = (counts.assignee[assignee] || 0) + 1;
+    });
+
+    // Update status counts
+    Object.entries(counts.status).forEach(([status, count]) => {
+      const element = document.getElementById(`${status}-count`);
+      if (element) element.textContent = count;
+    });
+
+    // Update assignee counts and generate filter checkboxes
+    const assigneeFiltersContainer = document.getElementById('assigneeFilters');
+    const existingAssignees = new Set();
+
+    // Collect existing assignee checkboxes
+    assigneeFiltersContainer.querySelectorAll('input[name="assignee"]').forEach(input => {
+      if (input.value !== 'unassigned') {
+        existingAssignees.add(input.value);
+      }
+    });
+
+    // Add new assignee checkboxes
+    Object.entries(counts.assignee).forEach(([assignee, count]) => {
+      if (assignee !== 'unassigned' && !existingAssignees.has(assignee)) {
+        const label = document.createElement('label');
+        label.className = 'checkbox-label';
+        label.innerHTML = `
+          <input type="checkbox" name="assignee" value="${assignee}" checked>
+          <span>👤 ${assignee}</span>
+          <span class="filter-count" id="${assignee}-count">${count}</span>
+        `;
+        assigneeFiltersContainer.appendChild(label);
+      }
+
+      // Update count for existing assignee
+      const element = document.getElementById(`${assignee}-count`);
+      if (element) element.textContent = count;
+    });
+  }
+
+  // Get currently selected filter values
+  function getSelectedFilters() {
+    return {
+      status: Array.from(document.querySelectorAll('input[name="status"]:checked')).map(input => input.value),
+      assignee: Array.from(document.querySelectorAll('input[name="assignee"]:checked')).map(input => input.value)
+    };
+  }
+
+  // Apply filters to todo items
+  function applyFilters() {
+    const filters = getSelectedFilters();
+    let visibleCount = 0;
+
+    console.log('Applying filters:', filters);
+
+    // Find the "No tasks yet" message
+    const noTasksYetElement = Array.from(document.querySelectorAll('.todo-item')).find(
+      el => el.textContent && el.textContent.includes('No tasks yet')
+    );
+    // Find all real todo items (exclude the empty state message)
+    const realTodoItems = Array.from(document.querySelectorAll('.todo-item')).filter(
+      el => !el.textContent.includes('No tasks yet')
+    );
+
+    console.log('Real todo items found:', realTodoItems.length);
+
+    // If there are no real todo items, show the empty state and hide all others
+    if (realTodoItems.length === 0) {
+      if (noTasksYetElement) noTasksYetElement.style.display = '';
+      if (noResults) noResults.style.display = 'none';
+      // Hide any other .todo-item (shouldn't be any, but just in case)
+      document.querySelectorAll('.todo-item').forEach(el => {
+        if (el !== noTasksYetElement) el.style.display = 'none';
+      });
+      return;
+    } else {
+      // Hide the empty state message
+      if (noTasksYetElement) noTasksYetElement.style.display = 'none';
+    }
+
+    // Apply filters to real todo items
+    realTodoItems.forEach(element => {
+      const status = element.dataset.status;
+      const assignee = element.dataset.assignee || 'unassigned';
+
+      console.log('Checking element:', element.textContent.trim(), 'status:', status, 'assignee:', assignee);
+
+      // Check if status matches any selected status filter
+      const statusMatch = filters.status.length === 0 || filters.status.includes(status);
+
+      // Check if assignee matches any selected assignee filter
+      // For assignee filtering, if any assignee filters are selected, only show tasks that match those assignees
+      const assigneeMatch = filters.assignee.length === 0 || filters.assignee.includes(assignee);
+
+      const isVisible = statusMatch && assigneeMatch;
+      console.log('Element visibility:', isVisible, 'statusMatch:', statusMatch, 'assigneeMatch:', assigneeMatch, 'selected assignees:', filters.assignee);
+
+      element.style.display = isVisible ? '' : 'none';
+      if (isVisible) visibleCount++;
+    });
+
+    console.log('Visible count:', visibleCount);
+
+    // Show no results message only if there are items but none match filters
+    if (noResults) noResults.style.display = visibleCount === 0 ? '' : 'none';
+  }
+
+  // Add change event listeners to all filters
+  function setupFilterEventListeners() {
+    // Use event delegation for dynamically created filters
+    document.addEventListener('change', (event) => {
+      if (event.target.matches('input[name="status"], input[name="assignee"]')) {
+        console.log('Filter changed:', event.target.name, event.target.value, event.target.checked);
+        console.log('Current filters:', getSelectedFilters());
+        applyFilters();
+        updateCounts();
+      }
+    });
+
+    // Also add direct event listeners to existing checkboxes
+    document.querySelectorAll('input[name="status"], input[name="assignee"]').forEach(checkbox => {
+      checkbox.addEventListener('change', (event) => {
+        console.log('Direct filter change:', event.target.name, event.target.value, event.target.checked);
+        applyFilters();
+        updateCounts();
+      });
+    });
+  }
+
+  // Initial setup
+  updateCounts();
+  applyFilters();
+  setupFilterEventListeners();
+}
+
+// Initialize filters when the page loads
+document.addEventListener('DOMContentLoaded', function() {
+  console.log('DOM loaded, initializing filters...');
+  initializeFilters();
+
+  // Add a small delay to ensure everything is ready
+  setTimeout(() => {
+    console.log('Filters initialized, checking empty state...');
+    const todoItems = document.querySelectorAll('.todo-item');
+    console.log('Found', todoItems.length, 'todo items');
+
+    // If no todo items (except the "No tasks yet" message), ensure it's visible
+    const noTasksYet = document.querySelector('.todo-item:has-text("No tasks yet")');
+    if (noTasksYet) {
+      console.log('Found "No tasks yet" message, ensuring visibility');
+      noTasksYet.style.display = '';
+    }
+  }, 100);
+
+  const form = document.getElementById('transcriptForm');
+  if (form) {
+    form.addEventListener('submit', async function(e) {
+      e.preventDefault();
+
+      const text = document.getElementById('transcriptInput').value;
+      if (!text) {
+        alert('Please enter some text to extract action items from.');
+        return;
+      }
+
+      const extractionResult = document.getElementById('extractionResult');
+      extractionResult.innerHTML = '<div style="color: var(--gray-600);">🔄 Extracting action items...</div>';
+
+      try {
+        const response = await fetch('/extract-todos', {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ text: text })
+        });
+
+        const data = await response.json();
+
+        if (response.ok) {
+          // Show success message with count and reload notice
+          extractionResult.innerHTML = `
+            <div style="margin-top: 1rem; padding: 1rem; background: #d1fae5; border-radius: 8px; color: var(--success-hover); font-size: 1.1em; font-weight: 500;">
+              ✨ ${data.message}
+              <div style="margin-top: 0.5rem; font-size: 0.9em; color: var(--gray-600);">
+                  Refreshing page in 2 seconds...
+              </div>
+            </div>
+          `;
+
+          document.getElementById('transcriptInput').value = '';
+
+          // Fetch and update the todo list
+          const todosResponse = await fetch('/todos');
+          const todos = await todosResponse.json();
+
+          const todoList = document.getElementById('todoList');
+          todoList.innerHTML = todos.map(todo => `
+            <div class="todo-item ${todo.status}" 
+                 data-status="${todo.status}"
+                 data-assignee="${todo.assignee || 'unassigned'}">
+              <div class="todo-header">
+                <span class="status-badge status-${todo.status}">
+                  ${todo.status === 'todo' ? '⏳' : 
+                    todo.status === 'in_progress' ? '🔄' : '✅'}
+                  ${todo.status.replace('_', ' ')}
+                </span>
+                ${todo.assignee ? `
+                  <span class="assignee-badge">👥 ${todo.assignee}</span>
+                ` : ''}
+                <span class="task-text">${todo.task}</span>
+                <div class="todo-actions">
+                  <form action="/toggle/${todo.id}" method="post" style="margin: 0;">
+                    <button type="submit" class="toggle-btn">
+                      ${todo.status === 'todo' ? '🚀 Start' : 
+                        todo.status === 'in_progress' ? '✨ Complete' : '🔄 Reset'}
+                    </button>
+                  </form>
+                  <button onclick="toggleEditForm(${todo.id})" class="update-btn">✏️ Edit</button>
+                  <form action="/delete/${todo.id}" method="post" style="margin: 0;">
+                    <button type="submit" class="delete-btn">🗑️ Delete</button>
+                  </form>
+                </div>
+              </div>
+              <div class="todo-content">
+                ${todo.notes ? `
+                  <div class="notes">📝 ${todo.notes}</div>
+                ` : ''}
+                <div id="edit-form-${todo.id}" class="edit-form">
+                  <form action="/update_todo/${todo.id}" method="post">
+                    <div class="form-group">
+                      <label for="assignee-${todo.id}">👥 Assignee</label>
+                      <input type="text" id="assignee-${todo.id}" name="assignee" 
+                             placeholder="Who's responsible?" value="${todo.assignee || ''}">
+                    </div>
+                    <div class="form-group">
+                      <label for="notes-${todo.id}">📝 Notes</label>
+                      <textarea id="notes-${todo.id}" name="notes" 
+                                placeholder="Add any additional notes...">${todo.notes || ''}</textarea>
+                    </div>
+                    <button type="submit" class="update-btn">💾 Update Details</button>
+                  </form>
+                </div>
+              </div>
+            </div>
+          `).join('') || `
+            <div class="card">
+              <p style="text-align: center; color: var(--gray-500);">✨ No todos yet. Add one above! 🎯</p>
+            </div>
+          `;
+
+          // Add a delay before reloading
+          await new Promise(resolve => setTimeout(resolve, 2000));
+          window.location.reload();
+        } else {
+          extractionResult.innerHTML = `
+            <div style="margin-top: 1rem; padding: 1rem; background: #fee2e2; border-radius: 8px; color: var(--danger-hover);">
+              ❌ Error: ${data.error || 'Failed to extract action items'}
+            </div>
+          `;
+        }
+      } catch (error) {
+        console.error('Fetch error:', error);
+        extractionResult.innerHTML = `
+          <div style="margin-top: 1rem; padding: 1rem; background: #fee2e2; border-radius: 8px; color: var(--danger-hover);">
+            ❌ Error: Failed to send request to server
+          </div>
+        `;
+        }
+    });
+  }
+});
+
+function toggleEditForm(todoId) {
+  const form = document.getElementById(`edit-form-${todoId}`);
+  form.classList.toggle('active');
+}
@@ -105,4 +105,101 @@ test.describe('To-Do API', () => {
     });
     expect(response.status()).toBe(400);
   });
-}); 
\ No newline at end of file
+}); 
+
+test.describe('Static assets and compression', () => {
+  let api: APIRequestContext;
+
+  test.beforeAll(async () => {
+    api = await request.newContext({
+      baseURL: 'http://127.0.0.1:5000',
+    });
+  });
+
+  test.afterEach(async () => {
+    await deleteAllTodos(api);
+  });
+
+  test.afterAll(async () => {
+    await api.dispose();
+  });
+
+  // Collect the fingerprinted static URLs referenced by the index page
+  async function getStaticUrls(): Promise<string[]> {
+    const response: APIResponse = await api.get('/');
+    const html = await response.text();
+    return [...html.matchAll(/(?:href|src)="(\/static\/[^"]+)"/g)].map(match => match[1]);
+  }
+
+  test('should reference fingerprinted static assets', async () => {
+    const urls = await getStaticUrls();
+    expect(urls).toHaveLength(2);
+    expect(urls[0]).toMatch(/^\/static\/css\/style\.css\?v=[0-9a-f]{12}$/);
+    expect(urls[1]).toMatch(/^\/static\/js\/app\.js\?v=[0-9a-f]{12}$/);
+  });
+
+  test('should cache fingerprinted assets as immutable', async () => {
+    for (const url of await getStaticUrls()) {
+      const response: APIResponse = await api.get(url);
+      expect(response.status()).toBe(200);
+      expect(response.headers()['cache-control']).toBe('public, max-age=31536000, immutable');
+
+      // Revalidation must keep the long-lived headers
+      const revalidated: APIResponse = await api.get(url, {
+        headers: { 'If-None-Match': response.headers()['etag'] },
+      });
+      expect(revalidated.status()).toBe(304);
+      expect(revalidated.headers()['cache-control']).toBe('public, max-age=31536000, immutable');
+    }
+  });
+
+  test('should not cache assets without a matching fingerprint', async () => {
+    for (const url of ['/static/css/style.css', '/static/css/style.css?v=000000000000']) {
+      const response: APIResponse = await api.get(url);
+      expect(response.status()).toBe(200);
+      expect(response.headers()['cache-control']).toContain('no-cache');
+      expect(response.headers()['cache-control']).not.toContain('immutable');
+    }
+  });
+
+  test('should compress HTML responses', async () => {
+    const brotli: APIResponse = await api.get('/', {
+      headers: { 'Accept-Encoding': 'br, gzip' },
+    });
+    expect(brotli.headers()['content-encoding']).toBe('br');
+
+    const gzip: APIResponse = await api.get('/', {
+      headers: { 'Accept-Encoding': 'gzip' },
+    });
+    expect(gzip.headers()['content-encoding']).toBe('gzip');
+  });
+
+  test('should compress fingerprinted assets', async () => {
+    for (const url of await getStaticUrls()) {
+      const response: APIResponse = await api.get(url, {
+        headers: { 'Accept-Encoding': 'br, gzip' },
+      });
+      expect(response.status()).toBe(200);
+      expect(['br', 'gzip']).toContain(response.headers()['content-encoding']);
+    }
+  });
+
+  test('should compress JSON responses', async () => {
+    // Create enough todos to exceed the compression size threshold
+    for (let i = 0; i < 5; i++) {
+      await api.post('/todos', { data: { task: `Compressed todo ${i}` } });
+    }
+
+    const brotli: APIResponse = await api.get('/todos', {
+      headers: { 'Accept-Encoding': 'br, gzip' },
+    });
+    expect(brotli.headers()['content-encoding']).toBe('br');
+    const todos: Todo[] = await brotli.json();
+    expect(todos).toHaveLength(5);
+
+    const gzip: APIResponse = await api.get('/todos', {
+      headers: { 'Accept-Encoding': 'gzip' },
+    });
+    expect(gzip.headers()['content-encoding']).toBe('gzip');
+  });
+});
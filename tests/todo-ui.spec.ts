@@ -317,4 +317,20 @@ test.describe('To-Do UI', () => {
       await expect(johnCount).toHaveText('0');
     }
   });
-}); 
\ No newline at end of file
+
+  test('should load styles and scripts from static files', async ({ page }) => {
+    // The stylesheet is applied and the script defines its globals
+    await expect(page.locator('body')).toHaveCSS('font-family', /Inter/);
+    expect(await page.evaluate(() => typeof (window as any).toggleEditForm)).toBe('function');
+
+    // The edit toggle is driven by the external script
+    await addTodo(page, 'Static asset task');
+    const todo = page.locator('.todo-item').filter({ hasText: 'Static asset task' }).first();
+    const editForm = todo.locator('.edit-form');
+    await expect(editForm).not.toHaveClass(/active/);
+    await todo.locator('button:has-text("Edit")').click();
+    await expect(editForm).toHaveClass(/active/);
+    await todo.locator('button:has-text("Edit")').click();
+    await expect(editForm).not.toHaveClass(/active/);
+  });
+});
@@ -1,4 +1,5 @@
 import sys
+import hashlib
 from flask import Flask, request, jsonify, render_template, redirect, url_for, abort
 from flask_sqlalchemy import SQLAlchemy
 import os
@@ -8,6 +9,8 @@ from typing import Dict, Any, Optional, List
 import openai
 from dotenv import load_dotenv
 import requests
+from flask_compress import Compress
+from jinja2 import FileSystemBytecodeCache
 
 # Load environment variables
 load_dotenv()
@@ -33,6 +36,48 @@ app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///todos.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db = SQLAlchemy(app)
 
+# Compress HTML, JSON, CSS and JS responses (brotli preferred, gzip fallback).
+# Static files are streamed, and Flask-Compress cannot stream gzip, so they use brotli only.
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br']
+Compress(app)
+
+# Cache compiled templates on disk so restarts skip Jinja compilation
+JINJA_CACHE_DIR = os.path.join(app.instance_path, 'jinja_cache')
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+
+# Fingerprinted static assets can be cached by browsers for a year
+STATIC_MAX_AGE = 60 * 60 * 24 * 365
+_static_hashes: Dict[str, str] = {}
+
+def static_digest(filename: str) -> str:
+    """Return a short hash of a static file's contents."""
+    digest = _static_hashes.get(filename)
+    if digest is None or app.debug:
+        with open(os.path.join(app.static_folder, filename), 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:12]
+        _static_hashes[filename] = digest
+    return digest
+
+def static_url(filename: str) -> str:
+    """Return a static file URL fingerprinted with a hash of its contents."""
+    return url_for('static', filename=filename, v=static_digest(filename))
+
+app.jinja_env.globals['static_url'] = static_url
+
+@app.after_request
+def add_static_cache_headers(response: Any) -> Any:
+    """Mark static assets requested with their current fingerprint as immutable."""
+    if (request.endpoint == 'static'
+            and response.status_code in (200, 304)
+            and request.args.get('v') == static_digest(request.view_args['filename'])):
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.immutable = True
+        response.cache_control.no_cache = None
+    return response
+
 class Todo(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     task = db.Column(db.String(200), nullable=False)